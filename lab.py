@@ -52,6 +52,17 @@ class CarlaeEvaluationError(CarlaeError):
 ############################
 
 
+# token string -> parsed number or symbol, filled in by number_or_symbol; a
+# repeated symbol token always comes back as the same str object, so env
+# lookups can match keys by identity (a hand-rolled sys.intern)
+_token_cache = {}
+_TOKEN_CACHE_SIZE = 4096
+
+# entries put back into _token_cache whenever it is cleared, so the builtin
+# and special-form names keep resolving to the same str objects as their keys
+_token_cache_seed = {}
+
+
 def number_or_symbol(x):
     """
     Helper function: given a string, convert it to an integer or a float if
@@ -66,20 +77,32 @@ def number_or_symbol(x):
     >>> number_or_symbol('x')
     'x'
     """
+    # the same tokens recur throughout a program, so skip the exception-driven
+    # conversion below when a token has been seen before
     try:
-        return int(x)
+        return _token_cache[x]
+    except KeyError:
+        pass
+
+    try:
+        value = int(x)
     except ValueError:
         try:
-            return float(x)
+            value = float(x)
         except ValueError:
-            return x
+            value = x
+
+    # keep the cache bounded for long-running REPL sessions
+    if len(_token_cache) >= _TOKEN_CACHE_SIZE:
+        _token_cache.clear()
+        _token_cache.update(_token_cache_seed)
+
+    _token_cache[x] = value
+
+    return value
 
 
-parenthesis = ["(", ")"]
-keywords = [":=", "function"]
-whitespace = [" ", "\n"]
 comment = "#"
-delimiters = [*parenthesis, *whitespace]
 
 
 def tokenize(source):
@@ -90,54 +113,14 @@ def tokenize(source):
     Arguments:
         source (str): a string containing the source code of a Carlae
                       expression
-    """
-    tokens = []
-
-    current_token = ""
-    is_comment = False
-
-    # loop thr the chars in source
-    for char in source:
-        if char in delimiters:
-            # put current token into list of tokens if it exists
-            if current_token:
-                tokens.append(current_token)
 
-            current_token = ""
-
-        # ignore whitespaces
-        if char in whitespace:
-            if char == "\n":
-                is_comment = False
-            continue
-
-        if is_comment:
-            continue
-
-        # add parenthesis then move on
-        if char in parenthesis:
-            tokens.append(char)
-
-            continue
-
-        # assuming no string type and # is not in string
-        if char == comment:
-            is_comment = True
-            continue
-
-        # build up current token
-        current_token += char
-
-        # check if current token is a keyword
-        if current_token in keywords:
-            tokens.append(current_token)
-            current_token = ""
-
-    # if remaining token, add to tokens
-    if current_token:
-        tokens.append(current_token)
+    >>> tokenize("(+ 1 (* 2 3)) # comment")
+    ['(', '+', '1', '(', '*', '2', '3', ')', ')']
+    """
+    # drop comments line by line, then pad parens so str.split does the rest
+    code = "\n".join(line.partition(comment)[0] for line in source.splitlines())
 
-    return tokens
+    return code.replace("(", " ( ").replace(")", " ) ").split()
 
 
 def parse(tokens):
@@ -149,63 +132,37 @@ def parse(tokens):
 
     Arguments:
         tokens (list): a list of strings representing tokens
-    """
-    # base case -> one token
-    if len(tokens) == 1:
-        # edge case -> single parenthesis
-        if tokens[0] == "(" or tokens[0] == ")":
-            raise CarlaeSyntaxError()
 
-        return number_or_symbol(tokens[0])
-
-    # recursive case
-    groups = _group_tokens(tokens)
-    parsed_expression = [parse(group) for group in groups]
-
-    return parsed_expression
-
-
-def _group_tokens(tokens):
-    """ """
-    # check if enclosed in parenthesis
-    if tokens[0] != "(" or tokens[-1] != ")":
-        raise CarlaeSyntaxError()
+    >>> parse(['(', '+', '1', '(', '*', '2', '3', ')', ')'])
+    ['+', 1, ['*', 2, 3]]
+    """
+    # S-expression currently being built, and the enclosing ones below it
+    current = []
+    stack = []
 
-    inner_tokens = tokens[1:-1]
-    groups = []
-    opening_parenthesis_index = -1
-    paren_stack = 0
+    # local name lookups are cheaper than global ones, once per atom
+    convert = number_or_symbol
 
-    for i, token in enumerate(inner_tokens):
+    for token in tokens:
         if token == "(":
-            paren_stack += 1
-            if opening_parenthesis_index < 0:
-                opening_parenthesis_index = i
-
-            continue
-
-        if token == ")":
-
-            paren_stack -= 1
-
-            if paren_stack < 0:
+            stack.append(current)
+            current = []
+        elif token == ")":
+            # closing paren without a matching opening one
+            if not stack:
                 raise CarlaeSyntaxError()
 
-            if paren_stack == 0:
-                groups.append(inner_tokens[opening_parenthesis_index : i + 1])
-                opening_parenthesis_index = -1
-
-            continue
+            expression = current
+            current = stack.pop()
+            current.append(expression)
+        else:
+            current.append(convert(token))
 
-        if opening_parenthesis_index >= 0:
-            continue
-
-        groups.append([token])
-
-    if paren_stack > 0:
+    # unclosed parens, or not exactly one top-level expression
+    if stack or len(current) != 1:
         raise CarlaeSyntaxError()
 
-    return groups
+    return current[0]
 
 
 ######################
@@ -213,6 +170,21 @@ def _group_tokens(tokens):
 ######################
 
 
+def subtract(args):
+    # a single argument is negated
+    if len(args) == 1:
+        return -args[0]
+
+    # otherwise subtract each in turn, without slicing off args[1:]
+    args = iter(args)
+    value = next(args)
+
+    for arg in args:
+        value -= arg
+
+    return value
+
+
 def multiply(args):
     value = 1
 
@@ -223,53 +195,70 @@ def multiply(args):
 
 
 def divide(args):
-    value = args[0]
+    # walk an iterator rather than slicing off args[1:], which copies the list
+    args = iter(args)
+    value = next(args)
 
-    for arg in args[1:]:
+    for arg in args:
         value /= arg
 
     return value
 
 
 def assignment(variable, value, env):
-    env.set(variable, value)
+    env.variables[variable] = value
 
     return value
 
 
 carlae_builtins = {
     "+": sum,
-    "-": lambda args: -args[0] if len(args) == 1 else (args[0] - sum(args[1:])),
+    "-": subtract,
     "*": multiply,
     "/": divide,
     ":=": assignment,
 }
 
+_token_cache_seed.update((name, name) for name in carlae_builtins)
+_token_cache.update(_token_cache_seed)
+
 
 ##############
 # Evaluation #
 ##############
 
 
+# sentinel for bindings that don't exist, since None/0 can be valid values
+_MISSING = object()
+
+
 class Environment:
-    def __init__(self, init_bindings, parent_env=None):
+    __slots__ = ("variables", "parent", "names")
+
+    def __init__(self, init_bindings, parent_env=None, names=None):
         self.variables = init_bindings
         self.parent = parent_env
 
+        # every name that can ever be bound in this env, if known up front
+        # (true of function call envs), or None if anything may be bound
+        self.names = names
+
     def get(self, variable):
-        # get the variable binding
-        value = self.variables.get(variable)
+        """
+        Look up a variable binding, walking up through the parent envs
+        """
+        env = self
 
-        # if binding exists
-        if value:
-            return value
+        while env is not None:
+            value = env.variables.get(variable, _MISSING)
 
-        # binding doesn't exist, check if parent env exists
-        if not self.parent:
-            return None
+            # binding exists (even if it is falsy, like 0)
+            if value is not _MISSING:
+                return value
 
-        # get variable from parent env
-        return self.parent.get(variable)
+            env = env.parent
+
+        raise CarlaeNameError(variable)
 
     def set(self, variable, value):
         """
@@ -282,151 +271,515 @@ class Environment:
         return f"(variables: {pprint.pformat(self.variables)})"
 
 
-def _create_env(env):
-    if env:
-        return env
+# shared, read-only frame holding the builtins; global envs are its children
+_BUILTINS_ENV = Environment(dict(carlae_builtins))
 
-    builtins = Environment(carlae_builtins)
 
-    return Environment({}, builtins)
+# marks the point in _FunctionCode.analyze's walk where a definition's body
+# is finished
+_END = object()
 
 
-class CarlaeFunction:
-    def __init__(self, parameters, body, enclosing_env):
+class _FunctionCode:
+    """
+    Everything about a function definition that doesn't depend on the env
+    it is evaluated in, worked out once and shared by every closure created
+    from that definition.  free_vars, local_names and definitions are None
+    until analyze fills them in, along with those of every definition
+    nested in the body.
+    """
+
+    __slots__ = (
+        "parameters",
+        "body",
+        "definitions",
+        "called",
+        "compiled",
+        "free_vars",
+        "local_names",
+    )
+
+    def __init__(self, parameters, body, definitions=None):
         self.parameters = parameters
         self.body = body
+
+        # codes of the definitions nested in body, keyed by the id of the
+        # expression defining each one
+        self.definitions = definitions
+
+        # most bodies only ever run once, where compiling costs more than it
+        # saves, so the first call walks the tree and the second compiles it
+        self.called = False
+        self.compiled = None
+
+        # names the body may look up outside of its own call env
+        self.free_vars = None
+
+        # names that can ever be bound in the body's call env
+        self.local_names = None
+
+    def analyze(self):
+        """
+        Work out the free variables and local names of this definition, and
+        of every definition nested in its body, in one pass over the body.
+
+        Free variables err on the side of including names, which only makes
+        envs harder to skip.  The walk keeps its own stack rather than
+        recursing, so deeply nested definitions can't exhaust Python's.
+        """
+        self.definitions = {}
+        self.free_vars = set()
+        self.local_names = {p for p in self.parameters if type(p) is str}
+
+        # (expression, code of the definition it's in, None), or (_END, code,
+        # code of the enclosing definition) once all of code's body is visited
+        stack = [(_END, self, None), (self.body, self, None)]
+
+        while stack:
+            tree, code, enclosing = stack.pop()
+
+            if tree is _END:
+                # parameters are the only names certain to be found in the
+                # body's own env, since a := may run after a lookup
+                parameter_names = {p for p in code.parameters if type(p) is str}
+                code.free_vars = frozenset(code.free_vars - parameter_names)
+                code.local_names = frozenset(code.local_names)
+
+                # whatever a nested definition looks up outside its own env is
+                # looked up from the enclosing one's env too
+                if enclosing is not None:
+                    enclosing.free_vars |= code.free_vars
+
+                continue
+
+            if type(tree) is str:
+                code.free_vars.add(tree)
+                continue
+
+            if type(tree) is not list or not tree:
+                continue
+
+            keyword = tree[0]
+
+            if len(tree) == 3 and keyword == "function" and type(tree[1]) is list:
+                # (function (params...) body)
+                nested_parameters = tree[1]
+            elif len(tree) == 3 and keyword == ":=":
+                target = tree[1]
+
+                # (:= name expr) binds name here, and only evaluates expr
+                if type(target) is not list:
+                    if type(target) is str:
+                        code.local_names.add(target)
+
+                    stack.append((tree[2], code, None))
+                    continue
+
+                # malformed, so raises before evaluating anything
+                if not target:
+                    continue
+
+                # (:= (name params...) body) binds name here
+                if type(target[0]) is str:
+                    code.local_names.add(target[0])
+
+                nested_parameters = target[1:]
+            else:
+                for expression in tree:
+                    if type(expression) is str:
+                        code.free_vars.add(expression)
+                    elif type(expression) is list:
+                        stack.append((expression, code, None))
+
+                continue
+
+            nested_parameters = tuple(nested_parameters)
+            nested = _FunctionCode(nested_parameters, tree[2], self.definitions)
+            nested.free_vars = set()
+            nested.local_names = {p for p in nested_parameters if type(p) is str}
+            self.definitions[id(tree)] = nested
+
+            stack.append((_END, nested, code))
+            stack.append((tree[2], nested, None))
+
+    def compile(self):
+        """
+        Compile the body, caching the result for every later call.  Like
+        compiling, the analysis only pays off for bodies that run repeatedly,
+        so it is done here too.
+        """
+        if self.free_vars is None:
+            self.analyze()
+
+        self.compiled = _compile(self.body, True, self.definitions)
+
+        return self.compiled
+
+
+class CarlaeFunction:
+    __slots__ = ("parameters", "body", "enclosing_env", "_arity", "_code")
+
+    def __init__(self, parameters, body, enclosing_env, code=None):
+        self.parameters = tuple(parameters)
+        self.body = body
+        self._arity = len(self.parameters)
+
+        if code is None:
+            code = _FunctionCode(self.parameters, body)
+
+        self._code = code
+
+        # call envs can only ever hold their own locals, so skip past any that
+        # bind none of the names this function looks up; lookups from the
+        # body then never walk through them.  Only analyzed definitions know
+        # their free variables, but those made in a call env with known
+        # names were analyzed along with that call's function
+        free_vars = code.free_vars
+
+        if free_vars is not None:
+            while enclosing_env.names is not None:
+                if not enclosing_env.names.isdisjoint(free_vars):
+                    break
+
+                enclosing_env = enclosing_env.parent
+
         self.enclosing_env = enclosing_env
 
-    def call(self, arguments):
+    def bind(self, arguments):
+        """
+        Create the environment for a call on a list of already-evaluated
+        arguments
+        """
         # different number of parameters -> error
-        if len(self.parameters) != len(arguments):
-            # print(self.parameters)
-            # print(arguments)
+        if self._arity != len(arguments):
             raise CarlaeEvaluationError()
 
-        # evaluate arguments of function
-        evaluated_arguments = [evaluate(arg, self.enclosing_env) for arg in arguments]
+        # create environment for function with the parameters already bound;
+        # until the definition is analyzed its locals are unknown, so nothing
+        # can skip past this env
+        bindings = dict(zip(self.parameters, arguments))
 
-        # create environment for function
-        func_env = Environment({}, self.enclosing_env)
+        return Environment(bindings, self.enclosing_env, self._code.local_names)
 
-        # bind variables to environment
-        for var, val in zip(self.parameters, evaluated_arguments):
-            func_env.set(var, val)
+    def call(self, arguments):
+        """
+        Call the function on a list of already-evaluated arguments
+        """
+        func = self
 
-        # evalute the function body in the function environment
-        return_value = evaluate(self.body, func_env)
+        # calls in tail position hand back a _TailCall rather than recursing,
+        # so chains of them run in this loop on a single Python frame
+        while True:
+            code = func._code
 
-        return return_value
+            # compile (and so analyze) before binding, so that this call's env
+            # already knows its names
+            if code.called and code.compiled is None:
+                code.compile()
+
+            env = func.bind(arguments)
+
+            if code.compiled is not None:
+                result = code.compiled(env)
+            else:
+                code.called = True
+                result = _walk(code.body, env, code.definitions, tail=True)
+
+            if type(result) is not _TailCall:
+                return result
+
+            func, arguments = result.func, result.arguments
 
     def __str__(self):
         return f"parameters: {self.parameters}, body: {self.body}"
 
 
-def create_function(parameters, body, enclosing_env):
-    return CarlaeFunction(parameters, body, enclosing_env)
+class _TailCall:
+    """
+    A pending call of a CarlaeFunction, returned by function bodies (walked
+    or compiled) in place of making the call themselves
+    """
+
+    __slots__ = ("func", "arguments")
 
+    def __init__(self, func, arguments):
+        self.func = func
+        self.arguments = arguments
 
-def evaluate(tree, env=None):
+
+def create_function(parameters, body, enclosing_env, code=None):
+    return CarlaeFunction(parameters, body, enclosing_env, code)
+
+
+def _function_code(tree, parameters, body, definitions):
     """
-    Evaluate the given syntax tree according to the rules of the Carlae
-    language.
+    Return the _FunctionCode for the definition expression tree, reusing the
+    one made when the definition enclosing it was analyzed, if there is one
+    """
+    code = definitions.get(id(tree)) if definitions is not None else None
 
-    Arguments:
-        tree (type varies): a fully parsed expression, as the output from the
-                            parse function
+    if code is None:
+        code = _FunctionCode(parameters, body)
+
+    return code
+
+
+def _malformed(env):
+    raise CarlaeSyntaxError()
+
+
+def _eval_assign(tree, env, definitions):
+    """
+    Evaluate a variable assignment, (:= name expr), or the shorthand
+    function definition, (:= (name params...) body)
     """
+    if len(tree) != 3:
+        raise CarlaeSyntaxError()
 
-    env = _create_env(env)
+    # handle function assignment -> shorthand
+    if type(tree[1]) is list:
+        if not tree[1]:
+            raise CarlaeSyntaxError()
 
-    if tree == []:
-        return []
+        func_name = tree[1][0]
+        parameters = tuple(tree[1][1:])
+        body = tree[2]
+        code = _function_code(tree, parameters, body, definitions)
 
-    # check if tree is a number or a builtin carlae type
-    if isinstance(tree, int) or isinstance(tree, float):
-        return tree
+        func = create_function(parameters, body, env, code)
 
-    if isinstance(tree, str):
-        val = env.get(tree)
+        return assignment(func_name, func, env)
 
-        if val is None:
-            raise CarlaeNameError()
+    # get parts from assignment expression
+    _, variable, expression = tree
 
-        return val
+    value = _walk(expression, env, definitions)
 
-    if isinstance(tree, CarlaeFunction):
-        return tree
+    # set variable binding
+    return assignment(variable, value, env)
 
-    keyword = tree[0]
 
-    # variable assignment
-    if keyword == ":=":
-        # handle function assignment -> shorthand
-        is_shorthand_func_def = isinstance(tree[1], list)
+def _eval_lambda(tree, env, definitions):
+    """
+    Evaluate a function definition, (function (params...) body)
+    """
+    if len(tree) != 3 or type(tree[1]) is not list:
+        raise CarlaeSyntaxError()
+
+    # get parameters and body of function
+    _, parameters, body = tree
+    parameters = tuple(parameters)
+    code = _function_code(tree, parameters, body, definitions)
+
+    return create_function(parameters, body, env, code)
+
+
+def _compile_assign(tree, definitions):
+    """
+    Compile a variable assignment, (:= name expr), or the shorthand
+    function definition, (:= (name params...) body)
+    """
+    if len(tree) != 3:
+        return _malformed
+
+    # handle function assignment -> shorthand
+    is_shorthand_func_def = type(tree[1]) is list
 
-        if is_shorthand_func_def:
-            # print("is short hand function def")
+    if is_shorthand_func_def:
+        if not tree[1]:
+            return _malformed
 
-            func_name = tree[1][0]
-            parameters = tree[1][1:]
-            body = tree[2]
+        func_name = tree[1][0]
+        parameters = tuple(tree[1][1:])
+        body = tree[2]
+        code = _function_code(tree, parameters, body, definitions)
 
-            func = create_function(parameters, body, env)
+        def assign_function(env):
+            func = create_function(parameters, body, env, code)
 
             return assignment(func_name, func, env)
 
-        # get parts from assignment expression
-        _, variable, expression = tree
+        return assign_function
+
+    # get parts from assignment expression
+    _, variable, expression = tree
+    compiled_expression = _compile(expression, False, definitions)
+
+    def assign(env):
+        # set variable binding, writing the env's dict directly on this hot path
+        value = compiled_expression(env)
+        env.variables[variable] = value
+
+        return value
+
+    return assign
+
+
+def _compile_lambda(tree, definitions):
+    """
+    Compile a function definition, (function (params...) body)
+    """
+    if len(tree) != 3 or type(tree[1]) is not list:
+        return _malformed
+
+    # get parameters and body of function
+    _, parameters, body = tree
+    parameters = tuple(parameters)
+    code = _function_code(tree, parameters, body, definitions)
+
+    return lambda env: create_function(parameters, body, env, code)
+
 
-        evaluated_expression = evaluate(expression, env)
+# keyword -> handler(tree, env, definitions) for expressions that aren't
+# function calls, and the matching compiler(tree, definitions); since none of
+# them is a call, neither takes the tail flag
+_SPECIAL_FORMS = {
+    ":=": _eval_assign,
+    "function": _eval_lambda,
+}
+
+_SPECIAL_FORM_COMPILERS = {
+    ":=": _compile_assign,
+    "function": _compile_lambda,
+}
+
+_token_cache_seed.update((keyword, keyword) for keyword in _SPECIAL_FORMS)
+_token_cache.update(_token_cache_seed)
+
+
+def _compile(tree, tail=False, definitions=None):
+    """
+    Compile a syntax tree into a Python function taking an env and returning
+    the value of the tree in that env, so the tree is only walked once no
+    matter how many times the result runs.
+
+    If tail is True, the tree is the body of a CarlaeFunction and a call to
+    another CarlaeFunction in tail position returns a _TailCall instead of
+    making the call.
+
+    definitions holds the codes for the function definitions in tree, as
+    made by _FunctionCode.analyze for the definition it is the body of, if
+    any.
+    """
+    # parsed trees only ever hold exact ints, floats, strs and lists, so
+    # compare types directly rather than going through isinstance
+    tree_type = type(tree)
 
-        # set variable binding
-        return assignment(variable, evaluated_expression, env)
-    elif keyword == "function":
-        # get parameters and body of function
-        _, parameters, body = tree
+    if tree_type is str:
+        return lambda env: env.get(tree)
 
-        return create_function(parameters, body, env)
+    if tree_type is not list:
+        # numbers and other values evaluate to themselves
+        return lambda env: tree
 
-    # evaluate each expression in the tree
-    evaluated_expressions = [evaluate(expression, env) for expression in tree]
+    if not tree:
+        return lambda env: []
 
-    # check if first evaluated expression is a function
-    func = evaluated_expressions[0]
+    # special forms get their own evaluation rules
+    keyword = tree[0]
+    special_form = (
+        _SPECIAL_FORM_COMPILERS.get(keyword) if type(keyword) is str else None
+    )
 
-    # check if it's a CarlaeFunction
-    if isinstance(func, CarlaeFunction):
-        # print(evaluated_expressions)
+    if special_form is not None:
+        return special_form(tree, definitions)
 
-        if len(evaluated_expressions) == 1:
-            # function with no arguments
-            return func.call([])
+    compiled_func = _compile(keyword, False, definitions)
+    compiled_args = [
+        _compile(expression, False, definitions) for expression in tree[1:]
+    ]
+    is_bare = len(tree) == 1
 
-        # get the args
-        args = evaluated_expressions[1:]
+    def apply(env):
+        # evaluate the function and its arguments in the current env
+        func = compiled_func(env)
+        args = [compiled_arg(env) for compiled_arg in compiled_args]
 
-        # call the function on the args
-        return func.call(args)
+        if type(func) is CarlaeFunction:
+            return _TailCall(func, args) if tail else func.call(args)
 
-    # if length of evaluated expressions is 1 return that value
-    if len(evaluated_expressions) == 1:
-        return evaluated_expressions[0]
+        # if there is nothing to apply, return the value itself
+        if is_bare:
+            return func
+
+        if not callable(func):
+            raise CarlaeEvaluationError()
+
+        # call the builtin on the evaluated arguments
+        return func(args)
+
+    return apply
+
+
+def _walk(tree, env, definitions=None, tail=False):
+    """
+    Evaluate a syntax tree in env by walking it directly, which is cheaper
+    than compiling for trees that only run once.  tail and definitions are
+    as for _compile.
+    """
+    # parsed trees only ever hold exact ints, floats, strs and lists, so
+    # compare types directly rather than going through isinstance
+    tree_type = type(tree)
+
+    if tree_type is str:
+        return env.get(tree)
+
+    if tree_type is not list:
+        # numbers and other values evaluate to themselves
+        return tree
+
+    if not tree:
+        return []
+
+    # special forms get their own evaluation rules
+    keyword = tree[0]
+    special_form = _SPECIAL_FORMS.get(keyword) if type(keyword) is str else None
+
+    if special_form is not None:
+        return special_form(tree, env, definitions)
+
+    # evaluate the function and its arguments in the current env
+    func = _walk(keyword, env, definitions)
+    args = [_walk(expression, env, definitions) for expression in tree[1:]]
+
+    if type(func) is CarlaeFunction:
+        return _TailCall(func, args) if tail else func.call(args)
+
+    # if there is nothing to apply, return the value itself
+    if len(tree) == 1:
+        return func
 
     if not callable(func):
         raise CarlaeEvaluationError()
 
-    # call the func on rest of evaluated expressions
-    evaluated = func(evaluated_expressions[1:])
+    # call the builtin on the evaluated arguments
+    return func(args)
+
+
+def evaluate(tree, env=None):
+    """
+    Evaluate the given syntax tree according to the rules of the Carlae
+    language.
+
+    Arguments:
+        tree (type varies): a fully parsed expression, as the output from the
+                            parse function
+    """
+
+    if env is None:
+        env = Environment({}, _BUILTINS_ENV)
 
-    return evaluated
+    return _walk(tree, env)
 
 
 def result_and_env(tree, env=None):
     # initialize environment for evaluation
-    current_env = _create_env(env)
-    evaluated = evaluate(tree, current_env)
+    if env is None:
+        env = Environment({}, _BUILTINS_ENV)
+
+    evaluated = evaluate(tree, env)
 
-    return evaluated, current_env
+    return evaluated, env
 
 
 def run_carlae(raw_carlae_str, env=None):
@@ -438,8 +791,7 @@ def run_carlae(raw_carlae_str, env=None):
 
 
 def run_repl():
-    builtins = Environment(carlae_builtins)
-    global_env = Environment({}, builtins)
+    global_env = Environment({}, _BUILTINS_ENV)
 
     while True:
         raw_carlae_str = input("in> ")
@@ -450,9 +802,6 @@ def run_repl():
         try:
             value = run_carlae(raw_carlae_str, global_env)
             print(f"out> {value}")
-
-            # print(global_env)
-
         except Exception as e:
             exception_name = e.__class__.__name__
             print(exception_name)
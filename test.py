@@ -302,6 +302,42 @@ def test_nested_defines():
     do_raw_continued_evaluations(28)
 
 
+def test_falsy_bindings():
+    do_raw_continued_evaluations(29)
+
+
+def test_builtin_arguments():
+    do_raw_continued_evaluations(30)
+
+
+def test_closure_envs():
+    do_raw_continued_evaluations(31)
+
+
+def test_token_cache_reseed():
+    # overflow the token cache so it is cleared and reseeded at least once
+    for i in range(lab._TOKEN_CACHE_SIZE + 100):
+        lab.parse([f"symbol-{i}"])
+
+    assert len(lab._token_cache) <= lab._TOKEN_CACHE_SIZE
+    assert "symbol-0" not in lab._token_cache
+
+    # builtin and special-form names still parse to their dict keys
+    for name in ["+", "-", "*", "/", ":=", "function"]:
+        assert name in lab._token_cache
+        assert lab.parse([name]) is lab._token_cache_seed[name]
+
+    env = None
+    for source, expected in [
+        ("(:= (triple x) (* x 3))", None),
+        ("(triple 4)", 12),
+        ("((function (x) (- (triple x) (/ x 2) (+ x 1))) 4)", 5.0),
+    ]:
+        value, env = lab.result_and_env(lab.parse(lab.tokenize(source)), env)
+        if expected is not None:
+            assert value == expected, source
+
+
 if __name__ == "__main__":
     import os
     import sys